@@ -4,13 +4,112 @@ Cordova Android Health Check Script v3
 Enhanced with dynamic emulator detection and snapshot handling
 """
 
+import asyncio
 import subprocess
 import sys
 import os
+import queue
 import time
 import re
+import select
+import shutil
+import signal
+import threading
+import xml.etree.ElementTree as ET
 from pathlib import Path
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Marks the end of each command's output on the persistent adb shell
+_SHELL_SENTINEL = "__END__"
+
+_EMU_DEVICE_RE = re.compile(r'(emulator-\d+)\s+device')
+_WIDGET_ID_RE = re.compile(r'<widget[^>]*id="([^"]+)"')
+
+# Steps 3-5 of the readiness check share one shell round-trip
+_READINESS_PROBE = 'echo B=$(getprop sys.boot_completed); echo P=$(pm path android); service check package'
+_BOOT_DONE_RE = re.compile(r'^B=1\s*$', re.M)
+_PM_READY_RE = re.compile(r'^P=package:', re.M)
+_SERVICE_READY_RE = re.compile(r'package:\s*found')
+
+_EMULATOR_PROCESS_NAMES = (
+    "emulator.exe", "qemu-system-x86_64.exe", "qemu-system-aarch64.exe",
+    "emulator", "qemu-system-x86_64", "qemu-system-aarch64",
+)
+
+def _wait_process(proc, timeout=None):
+    """Block until proc exits on a kernel wait handle; returns False on timeout"""
+    if proc.poll() is not None:
+        return True
+    
+    if sys.platform == "linux" and hasattr(os, "pidfd_open"):
+        try:
+            fd = os.pidfd_open(proc.pid)
+        except OSError:
+            # Kernels before 5.3 lack pidfd_open (ENOSYS)
+            fd = None
+        if fd is not None:
+            try:
+                poller = select.poll()
+                poller.register(fd, select.POLLIN)
+                if not poller.poll(None if timeout is None else int(timeout * 1000)):
+                    return False
+            finally:
+                os.close(fd)
+            proc.wait()
+            return True
+    
+    elif sys.platform == "win32":
+        import ctypes
+        from ctypes import wintypes
+        INFINITE = 0xFFFFFFFF
+        WAIT_TIMEOUT = 0x102
+        ms = INFINITE if timeout is None else int(timeout * 1000)
+        rc = ctypes.windll.kernel32.WaitForSingleObject(
+            wintypes.HANDLE(int(proc._handle)), wintypes.DWORD(ms)
+        )
+        if rc == WAIT_TIMEOUT:
+            return False
+        proc.wait()
+        return True
+    
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    return True
+
+def _wait_for_exit_or_interrupt(proc):
+    """Block until proc exits or Ctrl+C is pressed; returns True if interrupted"""
+    stop_event = threading.Event()
+    interrupted = []
+    
+    def on_sigint(signum, frame):
+        interrupted.append(signum)
+        stop_event.set()
+    
+    def watch_process():
+        _wait_process(proc)
+        stop_event.set()
+    
+    previous_handler = signal.signal(signal.SIGINT, on_sigint)
+    threading.Thread(target=watch_process, daemon=True).start()
+    try:
+        if sys.platform == "win32":
+            # Windows only runs the handler between slices of a timed wait
+            while not stop_event.wait(1):
+                pass
+        else:
+            # POSIX runs the handler during an untimed wait; no periodic wakeups
+            stop_event.wait()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+    
+    return bool(interrupted)
+
 class CordovaHealthCheck:
     def __init__(self):
         self.issues = []
@@ -19,9 +118,20 @@ class CordovaHealthCheck:
         self.cordova_project_dir = os.getcwd()
         self.emulator_process = None
         self.emulator_serial = None
+        self._emulator_started = False
+        # Resolve the SDK tools once instead of searching PATH on every spawn
+        self.adb = shutil.which("adb") or "adb"
+        self.emulator_bin = shutil.which("emulator") or "emulator"
+        self._shell = None
+        self._shell_serial = None
+        self._apk_path = None
+        self._package_name = None
         
-    def run_command(self, cmd, capture_output=True, shell=True, timeout=60):
-        """Execute a command and return result"""
+    def run_command(self, cmd, capture_output=True, shell=None, timeout=60):
+        """Execute a command (shell string or argv list) and return result"""
+        # argv lists skip the intermediate cmd.exe / sh process
+        if shell is None:
+            shell = isinstance(cmd, str)
         try:
             if capture_output:
                 result = subprocess.run(cmd, shell=shell, capture_output=True, text=True, timeout=timeout)
@@ -30,24 +140,154 @@ class CordovaHealthCheck:
                 result = subprocess.run(cmd, shell=shell, text=True, timeout=timeout)
                 return result
         except subprocess.TimeoutExpired:
-            self.issues.append(f"Command timed out: {cmd}")
+            self.issues.append(f"Command timed out: {self._format_command(cmd)}")
             return None
         except Exception as e:
-            self.issues.append(f"Error executing command '{cmd}': {str(e)}")
+            self.issues.append(f"Error executing command '{self._format_command(cmd)}': {str(e)}")
             return None
 
+    @staticmethod
+    def _format_command(cmd):
+        """Render a shell string or argv list the way it would be typed"""
+        return cmd if isinstance(cmd, str) else subprocess.list2cmdline(cmd)
+
     def get_active_emulator_serial(self):
         """Dynamically detect the active emulator serial"""
-        result = self.run_command("adb devices")
+        if self.emulator_serial:
+            return self.emulator_serial
+        
+        result = self.run_command([self.adb, "devices"])
         if result and result.stdout:
             # Look for emulator-XXXX in the output
-            matches = re.findall(r'(emulator-\d+)\s+device', result.stdout)
-            if matches:
-                return matches[0]
+            match = _EMU_DEVICE_RE.search(result.stdout)
+            if match:
+                return match.group(1)
+        return None
+
+    def wait_for_emulator_serial(self, timeout=90):
+        """Poll ADB until the emulator registers, backing off after the first 10 seconds"""
+        start_time = time.time()
+        delay = 1
+        
+        while time.time() - start_time < timeout:
+            serial = self.get_active_emulator_serial()
+            if serial:
+                return serial
+            
+            # Emulator process exited before it ever showed up
+            if self.emulator_process and self.emulator_process.poll() is not None:
+                return None
+            
+            # 1s interval for the first 10s, then 2s, 4s, capped at 5s
+            if time.time() - start_time >= 10:
+                delay = min(delay * 2, 5)
+            time.sleep(delay)
+        
         return None
 
+    def _wait_adb_alive(self, max_wait=10):
+        """Poll 'adb devices' with exponential backoff until the ADB server answers"""
+        start_time = time.time()
+        delay = 0.1
+        
+        while time.time() - start_time < max_wait:
+            result = self.run_command([self.adb, "devices"], timeout=max_wait)
+            # A "daemon started" banner means this call had to spin the server up itself
+            if result and result.returncode == 0 and "daemon" not in (result.stdout + result.stderr):
+                return result
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        
+        return None
+
+    async def run_adb_async(self, *args, timeout=10):
+        """Run an adb command without blocking the event loop"""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.adb, *args,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except OSError:
+            return None
+        
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return None
+        
+        return subprocess.CompletedProcess(args, proc.returncode, stdout.decode(errors="replace"), "")
+
+    def _open_shell(self):
+        """Start a long-lived 'adb shell' session for the current emulator"""
+        self._close_shell()
+        self._shell = subprocess.Popen(
+            [self.adb, "-s", self.emulator_serial, "shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+        self._shell_serial = self.emulator_serial
+
+    def _close_shell(self):
+        """Terminate the persistent adb shell session, if any"""
+        if self._shell:
+            try:
+                self._shell.kill()
+                self._shell.wait()
+            except Exception:
+                pass
+            self._shell = None
+            self._shell_serial = None
+
+    def _shell_exec(self, cmd):
+        """Run a command on the persistent adb shell instead of spawning a new adb client"""
+        if not self._shell or self._shell.poll() is not None or self._shell_serial != self.emulator_serial:
+            self._open_shell()
+        shell = self._shell
+        
+        try:
+            shell.stdin.write(f"{cmd}; echo {_SHELL_SENTINEL}$?\n")
+            shell.stdin.flush()
+        except OSError:
+            return None
+        
+        output = []
+        while True:
+            line = shell.stdout.readline()
+            if not line:
+                # Shell died; the next call reopens it
+                return None
+            line = line.rstrip("\r\n")
+            marker = line.find(_SHELL_SENTINEL)
+            if marker != -1:
+                if marker:
+                    output.append(line[:marker])
+                returncode = int(line[marker + len(_SHELL_SENTINEL):] or 0)
+                return subprocess.CompletedProcess(cmd, returncode, "\n".join(output), "")
+            output.append(line)
+
+    async def shell_probe_async(self, timeout=10):
+        """Run the batched readiness probe in a worker thread, resetting the shell if it hangs"""
+        try:
+            # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+            loop = asyncio.get_running_loop()
+            return await asyncio.wait_for(loop.run_in_executor(None, self._shell_exec, _READINESS_PROBE), timeout)
+        except asyncio.TimeoutError:
+            # Killing the shell unblocks the worker thread's pending read
+            self._close_shell()
+            return None
+
     def wait_for_device_fully_ready(self, timeout=180):
         """Wait for device to be fully ready with dynamic serial detection"""
+        return asyncio.run(self.async_wait_for_device_fully_ready(timeout))
+
+    async def async_wait_for_device_fully_ready(self, timeout=180):
+        """Poll device readiness, firing the per-tick ADB probes concurrently"""
         print("⏳ Waiting for device to be fully ready...")
         
         start_time = time.time()
@@ -57,51 +297,57 @@ class CordovaHealthCheck:
         while time.time() - start_time < timeout:
             try:
                 # Step 1: Detect emulator serial dynamically
-                if not self.emulator_serial:
+                if self.emulator_serial:
+                    steps_passed = max(steps_passed, 1)
+                else:
                     self.emulator_serial = self.get_active_emulator_serial()
                     if self.emulator_serial:
                         steps_passed = max(steps_passed, 1)
                         print(f"✅ Step 1/5: Emulator detected ({self.emulator_serial})")
                     else:
-                        time.sleep(5)
+                        await asyncio.sleep(5)
                         continue
                 
+                # Step 2 and the batched shell probe for steps 3-5 are independent, so fire them together
+                serial = self.emulator_serial
+                devices_result, probe_result = await asyncio.gather(
+                    self.run_adb_async("devices"),
+                    self.shell_probe_async()
+                )
+                probe_output = probe_result.stdout if probe_result else ""
+                
                 # Step 2: Check if device is recognized and online
-                devices_result = self.run_command("adb devices")
-                if devices_result and self.emulator_serial in devices_result.stdout and "offline" not in devices_result.stdout:
+                if devices_result and serial in devices_result.stdout and "offline" not in devices_result.stdout:
                     steps_passed = max(steps_passed, 2)
                     if steps_passed == 2:
                         print("✅ Step 2/5: ADB device online")
                     
                     # Step 3: Check boot completion
-                    boot_result = self.run_command(f"adb -s {self.emulator_serial} shell getprop sys.boot_completed", timeout=10)
-                    if boot_result and "1" in boot_result.stdout.strip():
+                    if _BOOT_DONE_RE.search(probe_output):
                         steps_passed = max(steps_passed, 3)
                         if steps_passed == 3:
                             print("✅ Step 3/5: System boot completed")
                         
                         # Step 4: Check package manager is ready
-                        pm_result = self.run_command(f"adb -s {self.emulator_serial} shell pm path android", timeout=10)
-                        if pm_result and pm_result.returncode == 0:
+                        if _PM_READY_RE.search(probe_output):
                             steps_passed = max(steps_passed, 4)
                             if steps_passed == 4:
                                 print("✅ Step 4/5: Package manager ready")
                             
                             # Step 5: Check if system is fully responsive
-                            service_result = self.run_command(f"adb -s {self.emulator_serial} shell service check package", timeout=10)
-                            if service_result and "found" in service_result.stdout:
+                            if _SERVICE_READY_RE.search(probe_output):
                                 steps_passed = max(steps_passed, 5)
                                 print("✅ Step 5/5: System services ready")
                                 print("🎉 Device is fully ready!")
                                 return True
                 
-                time.sleep(5)
+                await asyncio.sleep(5)
                 elapsed = int(time.time() - start_time)
                 print(f"⏳ Device readiness: {steps_passed}/{total_steps} (elapsed: {elapsed}s/{timeout}s)")
                 
             except Exception as e:
                 print(f"⚠️ Check interrupted: {e}")
-                time.sleep(5)
+                await asyncio.sleep(5)
         
         print(f"❌ Device not fully ready within {timeout} seconds. Progress: {steps_passed}/{total_steps}")
         return False
@@ -111,15 +357,13 @@ class CordovaHealthCheck:
         print("🔄 Performing aggressive ADB reset...")
         
         # Kill ADB server
-        self.run_command("adb kill-server", capture_output=False)
-        time.sleep(3)
+        self.run_command([self.adb, "kill-server"], capture_output=False)
         
         # Start ADB server
-        self.run_command("adb start-server", capture_output=False)
-        time.sleep(5)
+        self.run_command([self.adb, "start-server"], capture_output=False)
         
-        # List devices
-        result = self.run_command("adb devices")
+        # List devices once the server answers
+        result = self._wait_adb_alive()
         if result:
             print(f"📱 Connected devices:\n{result.stdout}")
         
@@ -132,16 +376,26 @@ class CordovaHealthCheck:
         """Clear potentially corrupted snapshots"""
         print("🗑️ Clearing emulator snapshots to avoid boot issues...")
         
-        avd_dir = os.path.expanduser(f"~/.android/avd/{self.avd_name}.avd")
-        if not os.path.exists(avd_dir):
-            avd_dir = os.path.expanduser(f"~\\.android\\avd\\{self.avd_name}.avd")
+        avd_dir = Path.home() / ".android" / "avd" / f"{self.avd_name}.avd"
         
-        if os.path.exists(avd_dir):
-            snapshot_dir = os.path.join(avd_dir, "snapshots")
-            if os.path.exists(snapshot_dir):
+        if avd_dir.is_dir():
+            snapshot_dir = avd_dir / "snapshots"
+            if snapshot_dir.exists():
+                # Native recursive delete is much faster than shutil.rmtree on large snapshot trees
+                if sys.platform == "win32":
+                    rm_cmd = ["cmd", "/c", "rd", "/s", "/q", str(snapshot_dir)]
+                else:
+                    rm_cmd = ["rm", "-rf", str(snapshot_dir)]
+                
                 try:
-                    import shutil
-                    shutil.rmtree(snapshot_dir)
+                    subprocess.run(rm_cmd, shell=False, capture_output=True, timeout=60)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+                
+                try:
+                    # Fall back to shutil.rmtree for anything the native delete left behind
+                    if snapshot_dir.exists():
+                        shutil.rmtree(snapshot_dir)
                     print("✅ Snapshots cleared")
                     return True
                 except Exception as e:
@@ -164,33 +418,38 @@ class CordovaHealthCheck:
             print(f"\n🚀 Starting emulator attempt {attempt + 1}/{max_retries}...")
             
             # Clean up any existing emulator processes
-            self.run_command("taskkill /f /im emulator.exe 2>nul", capture_output=False)
-            self.run_command("taskkill /f /im qemu-system-x86_64.exe 2>nul", capture_output=False)
-            time.sleep(5)
+            self.kill_orphaned_emulators()
             
-            # Reset emulator serial
+            # Reset emulator serial and cached build outputs
             self.emulator_serial = None
+            self._apk_path = None
+            self._package_name = None
             
             # Start emulator with options to avoid snapshot issues
-            emulator_cmd = f"emulator -avd {self.avd_name} -no-snapshot-load -no-snapshot-save -no-audio -gpu swiftshader_indirect"
+            emulator_cmd = [
+                self.emulator_bin, "-avd", self.avd_name,
+                "-no-snapshot-load", "-no-snapshot-save", "-no-audio",
+                "-gpu", "swiftshader_indirect"
+            ]
             
-            print(f"📝 Command: {emulator_cmd}")
+            print(f"📝 Command: {' '.join(emulator_cmd)}")
             
             try:
+                self._emulator_started = True
                 self.emulator_process = subprocess.Popen(
                     emulator_cmd,
-                    shell=True,
+                    shell=False,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
                     text=True
                 )
                 
-                # Wait for emulator to initialize
-                print("⏳ Waiting for emulator to initialize (45 seconds)...")
-                time.sleep(45)
+                # Wait for emulator to register with ADB
+                print("⏳ Waiting for emulator to appear in ADB...")
+                self.emulator_serial = self.wait_for_emulator_serial()
                 
-                # Reset ADB connection
-                if self.force_adb_reconnection():
+                # Reset ADB connection only if the emulator never showed up
+                if self.emulator_serial or self.force_adb_reconnection():
                     print(f"✅ ADB connected to: {self.emulator_serial}")
                     
                     # Wait for device to be fully ready with longer timeout for cold boot
@@ -217,7 +476,8 @@ class CordovaHealthCheck:
         if self.emulator_process:
             try:
                 self.emulator_process.terminate()
-                self.emulator_process.wait(timeout=10)
+                if not _wait_process(self.emulator_process, timeout=10):
+                    self.emulator_process.kill()
             except:
                 try:
                     self.emulator_process.kill()
@@ -225,9 +485,54 @@ class CordovaHealthCheck:
                     pass
             self.emulator_process = None
         
-        # Also kill any orphaned emulator processes
-        self.run_command("taskkill /f /im emulator.exe 2>nul", capture_output=False)
-        self.run_command("taskkill /f /im qemu-system-x86_64.exe 2>nul", capture_output=False)
+        self._close_shell()
+        
+        # Also kill any orphaned emulator processes, but only once we've launched one
+        if self._emulator_started:
+            self.kill_orphaned_emulators()
+
+    def kill_orphaned_emulators(self, timeout=5):
+        """Kill leftover emulator/qemu processes and wait for them to exit"""
+        if psutil is None:
+            # Without psutil fall back to taskkill (Windows only) and a fixed grace period
+            if sys.platform != "win32":
+                return
+            killed = False
+            for image in ("emulator.exe", "qemu-system-x86_64.exe"):
+                result = self.run_command(f"taskkill /f /im {image} 2>nul", capture_output=False)
+                killed = killed or bool(result and result.returncode == 0)
+            if killed:
+                time.sleep(timeout)
+            return
+        
+        targets = [
+            p for p in psutil.process_iter(["name", "cmdline", "exe"])
+            if p.info["name"] in _EMULATOR_PROCESS_NAMES and self._is_sdk_emulator(p.info)
+        ]
+        for proc in targets:
+            try:
+                proc.kill()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        
+        # Blocks on the process handles instead of sleeping blindly
+        psutil.wait_procs(targets, timeout=timeout)
+
+    def _is_sdk_emulator(self, info):
+        """Tell our emulator apart from unrelated processes sharing its name (e.g. libvirt's qemu)"""
+        cmdline = info["cmdline"] or []
+        for i, arg in enumerate(cmdline):
+            if arg == "-avd" and cmdline[i + 1:i + 2] == [self.avd_name]:
+                return True
+            if arg == f"@{self.avd_name}":
+                return True
+        
+        # Anything else only counts when it runs from the SDK's emulator directory
+        exe = info["exe"]
+        if not (exe and os.path.isabs(self.emulator_bin)):
+            return False
+        sdk_emulator_dir = os.path.dirname(os.path.realpath(self.emulator_bin))
+        return os.path.realpath(exe).startswith(sdk_emulator_dir + os.sep)
 
     def install_and_run_cordova(self):
         """Install and run Cordova app with dynamic serial"""
@@ -261,7 +566,7 @@ class CordovaHealthCheck:
             print("🔄 Trying alternative installation method...")
             apk_path = self.find_apk_file()
             if apk_path:
-                install_cmd = f'adb -s {self.emulator_serial} install -r "{apk_path}"'
+                install_cmd = [self.adb, "-s", self.emulator_serial, "install", "-r", apk_path]
                 install_result = self.run_command(install_cmd, capture_output=False, timeout=60)
                 if install_result and install_result.returncode == 0:
                     print("✅ App installed via ADB")
@@ -269,7 +574,7 @@ class CordovaHealthCheck:
                     # Launch the app
                     package_name = self.get_package_name()
                     if package_name:
-                        launch_cmd = f'adb -s {self.emulator_serial} shell am start -n {package_name}/.MainActivity'
+                        launch_cmd = [self.adb, "-s", self.emulator_serial, "shell", "am", "start", "-n", f"{package_name}/.MainActivity"]
                         self.run_command(launch_cmd, capture_output=False)
                         print("✅ App launched")
                         return True
@@ -279,27 +584,51 @@ class CordovaHealthCheck:
 
     def find_apk_file(self):
         """Find the built APK file"""
-        possible_paths = [
-            "platforms/android/app/build/outputs/apk/debug/app-debug.apk",
-            "platforms/android/app/build/outputs/apk/debug/app-debug-unaligned.apk", 
-            "platforms/android/build/outputs/apk/debug/app-debug.apk",
-        ]
+        if self._apk_path is None:
+            self._apk_path = self._locate_apk_file()
+        return self._apk_path
+
+    def _locate_apk_file(self):
+        """Scan the Cordova build output for the APK"""
+        apk_dir = Path(self.cordova_project_dir) / "platforms/android/app/build/outputs/apk/debug"
+        try:
+            with os.scandir(apk_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".apk") and entry.is_file():
+                        return entry.path
+            return None
+        except FileNotFoundError:
+            pass
         
-        for path in possible_paths:
-            full_path = os.path.join(self.cordova_project_dir, path)
-            if os.path.exists(full_path):
-                return full_path
+        # Output directory missing; try the layout used by older cordova-android releases
+        legacy_path = os.path.join(self.cordova_project_dir, "platforms/android/build/outputs/apk/debug/app-debug.apk")
+        if os.path.exists(legacy_path):
+            return legacy_path
         return None
 
     def get_package_name(self):
         """Extract package name from config.xml"""
+        if self._package_name is None:
+            self._package_name = self._read_package_name()
+        return self._package_name
+
+    def _read_package_name(self):
+        """Parse the widget id out of config.xml"""
         config_path = os.path.join(self.cordova_project_dir, "config.xml")
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                match = re.search(r'<widget[^>]*id="([^"]+)"', content)
-                if match:
-                    return match.group(1)
+            # Stream the file and stop at the root <widget> element
+            for event, elem in ET.iterparse(config_path, events=("start",)):
+                if elem.tag.endswith("widget"):
+                    return elem.attrib.get("id", "com.example.hello")
+                elem.clear()
+        except ET.ParseError:
+            try:
+                with open(config_path, 'r', encoding='utf-8') as f:
+                    match = _WIDGET_ID_RE.search(f.read())
+                    if match:
+                        return match.group(1)
+            except Exception as e:
+                print(f"⚠️ Could not read package name: {e}")
         except Exception as e:
             print(f"⚠️ Could not read package name: {e}")
         
@@ -310,22 +639,39 @@ class CordovaHealthCheck:
         print("🔍 Performing environment health checks...")
         
         checks = [
-            ("Java", "java -version"),
-            ("Node.js", "node --version"), 
-            ("Cordova", "cordova --version"),
-            ("ADB", "adb version")
+            ("Java", ["java", "-version"]),
+            ("Node.js", ["node", "--version"]), 
+            ("Cordova", "cordova --version"),  # cordova.cmd on Windows needs the shell
+            ("ADB", [self.adb, "version"])
         ]
         
+        # The probes are independent, so run them concurrently and bail on the first failure.
+        # Daemon threads, so a slow probe still in flight can't hold up interpreter exit
+        results = queue.Queue()
         for check_name, cmd in checks:
-            result = self.run_command(cmd)
-            if result and result.returncode == 0:
-                print(f"✅ {check_name} check passed")
-            else:
+            threading.Thread(
+                target=lambda name=check_name, cmd=cmd: results.put((name, self.run_command(cmd))),
+                daemon=True
+            ).start()
+        
+        passed = set()
+        for _ in checks:
+            check_name, result = results.get()
+            if not (result and result.returncode == 0):
+                self._report_passed_checks(checks, passed)
                 self.issues.append(f"{check_name} check failed")
                 return False
+            passed.add(check_name)
         
+        self._report_passed_checks(checks, passed)
         return True
 
+    def _report_passed_checks(self, checks, passed):
+        """Print passed checks in their original order"""
+        for check_name, _ in checks:
+            if check_name in passed:
+                print(f"✅ {check_name} check passed")
+
     def generate_report(self):
         """Generate health report"""
         print("\n" + "="*60)
@@ -372,9 +718,7 @@ def main():
                 print("\n📱 The app will stay open. Press Ctrl+C to stop the emulator when done.")
                 
                 # Keep the script running to maintain the emulator
-                try:
-                    health_check.emulator_process.wait()
-                except KeyboardInterrupt:
+                if _wait_for_exit_or_interrupt(health_check.emulator_process):
                     print("\n🛑 Stopping emulator...")
             else:
                 health_check.generate_report()
@@ -6,6 +6,7 @@ Quick emulator diagnostic - helps identify why emulator isn't connecting to ADB
 import subprocess
 import time
 import sys
+import os
 
 def run_cmd(cmd):
     """Run command and return result"""
@@ -16,6 +17,13 @@ def run_cmd(cmd):
         print(f"Error: {e}")
         return None
 
+def split_chunk(pending, chunk):
+    """Append a raw output chunk to pending and return the completed lines"""
+    pending += chunk
+    lines = pending.split(b'\n')
+    pending[:] = lines.pop()
+    return lines
+
 def main():
     print("🔍 EMULATOR DIAGNOSTIC TOOL")
     print("="*60)
@@ -74,55 +82,114 @@ def main():
             shell=True,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
+            bufsize=-1
         )
         
         # Monitor output for 90 seconds
         start_time = time.time()
         emulator_found = False
         
-        import threading
-        import queue
-        
-        def read_output(proc, q):
-            for line in iter(proc.stdout.readline, ''):
-                q.put(line)
-            q.put(None)
-        
-        q = queue.Queue()
-        thread = threading.Thread(target=read_output, args=(proc, q))
-        thread.daemon = True
-        thread.start()
+        if sys.platform == "win32":
+            # selectors cannot watch pipes on Windows, so a reader thread feeds a queue
+            import threading
+            import queue
+            
+            def read_output(proc, q):
+                fd = proc.stdout.fileno()
+                pending = bytearray()
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    lines = split_chunk(pending, chunk)
+                    if lines:
+                        q.put(lines)
+                if pending:
+                    q.put([bytes(pending)])
+                q.put(None)
+            
+            q = queue.Queue()
+            thread = threading.Thread(target=read_output, args=(proc, q))
+            thread.daemon = True
+            thread.start()
+            
+            def next_lines(timeout):
+                try:
+                    return q.get(timeout=timeout)
+                except queue.Empty:
+                    return []
+            
+            def wait_for_exit():
+                # The reader thread keeps draining the pipe on its own
+                proc.wait()
+        else:
+            # Non-blocking pipe watched by a selector; no extra thread needed
+            import fcntl
+            import selectors
+            
+            fd = proc.stdout.fileno()
+            fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) | os.O_NONBLOCK)
+            sel = selectors.DefaultSelector()
+            sel.register(fd, selectors.EVENT_READ)
+            pending = bytearray()
+            
+            def next_lines(timeout):
+                if not sel.select(timeout):
+                    return []
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    return []
+                if chunk:
+                    return split_chunk(pending, chunk)
+                if pending:
+                    lines = [bytes(pending)]
+                    pending.clear()
+                    return lines
+                return None
+            
+            def wait_for_exit():
+                # Nothing else reads the pipe now, so keep draining it; a full
+                # pipe buffer would block the emulator on its next log write
+                while next_lines(None) is not None:
+                    pass
+                proc.wait()
         
         print("\n📋 EMULATOR OUTPUT (first 90 seconds):\n")
         
-        while time.time() - start_time < 90:
-            try:
-                line = q.get(timeout=1)
-                if line is None:
-                    break
+        end_time = time.monotonic() + 90
+        adb_deadline = time.monotonic() + 15
+        
+        while time.monotonic() < end_time:
+            # Sleep until output arrives or the next ADB check is due
+            now = time.monotonic()
+            lines = next_lines(max(0, min(adb_deadline, end_time) - now))
+            if lines is None:
+                break
+            
+            for raw in lines:
+                line = raw.decode(errors="replace").rstrip()
                 
                 # Print line
-                print(line.rstrip())
+                print(line)
                 
                 # Check for key indicators
-                if "INFO" in line and "boot completed" in line.lower():
+                if b"INFO" in raw and b"boot completed" in raw.lower():
                     print("\n✅ BOOT COMPLETED DETECTED!")
                     emulator_found = True
                 
-                if "ERROR" in line:
-                    print(f"\n⚠️ ERROR DETECTED: {line.rstrip()}")
-                    
-            except queue.Empty:
-                # Check ADB every few seconds
-                if int(time.time() - start_time) % 15 == 0:
-                    print(f"\n[{int(time.time() - start_time)}s] Checking ADB devices...")
-                    result = run_cmd("adb devices")
-                    if result and "emulator-" in result.stdout and "device" in result.stdout:
-                        print("✅ EMULATOR APPEARED IN ADB!")
-                        emulator_found = True
-                        break
+                if b"ERROR" in raw:
+                    print(f"\n⚠️ ERROR DETECTED: {line}")
+            
+            # Check ADB every 15 seconds
+            if time.monotonic() >= adb_deadline:
+                print(f"\n[{int(time.time() - start_time)}s] Checking ADB devices...")
+                result = run_cmd("adb devices")
+                if result and "emulator-" in result.stdout and "device" in result.stdout:
+                    print("✅ EMULATOR APPEARED IN ADB!")
+                    emulator_found = True
+                    break
+                adb_deadline = time.monotonic() + 15
         
         print("\n" + "="*60)
         
@@ -137,7 +204,7 @@ def main():
                 print("\nPress Ctrl+C to stop the emulator...")
                 
                 try:
-                    proc.wait()
+                    wait_for_exit()
                 except KeyboardInterrupt:
                     print("\n🛑 Stopping emulator...")
                     proc.terminate()
@@ -1,9 +1,21 @@
+import argparse
+import hashlib
+import json
 import os
 import sys
+import ctypes
+import shutil
 import winreg
-import subprocess
 from pathlib import Path
-'''
+
+# subprocess and concurrent.futures are only needed by --deep-verify, so they are
+# imported there; pywin32 is optional
+try:
+    import win32gui
+    import win32con
+except ImportError:
+    win32gui = None
+r'''
 how to run the mobile app into the emulator
 step 1: python setup_cordova_path.py
 step 2: emulator -avd Pixel_7
@@ -13,30 +25,82 @@ step 4: open a chrome tab and run chrome://inspect/#devices
 WARNING      | adb command 'C:\Users\pc\AppData\Local\Android\Sdk\platform-tools\adb.exe -s 
 emulator-5554 shell am start-foreground-service -e meter on com.android.emulator.radio.config/.MeterService ' failed: 'adb.exe: device offline'
 '''
+
+INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+# Remembers the last successful run so unchanged re-runs can skip probing
+STATE_FILE = Path(os.environ.get('LOCALAPPDATA') or Path.home()) / 'cordova_path_setup' / 'state.json'
+
+if sys.platform == "win32":
+    from ctypes import wintypes
+    _GetFileAttributesW = ctypes.windll.kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+
+def _fast_exists(path):
+    """Check existence with a single attribute query instead of opening the path"""
+    if sys.platform != "win32":
+        return os.path.exists(path)
+    return _GetFileAttributesW(str(path)) != INVALID_FILE_ATTRIBUTES
+
+def _path_hash(path_value):
+    """Fingerprint a PATH value for the state cache"""
+    return hashlib.blake2b(path_value.encode('utf-8')).hexdigest()
+
+def _sdk_fingerprint(android_home):
+    """mtimes of the SDK directories whose contents decide the required paths"""
+    # Installing or removing a component (e.g. cmdline-tools) touches one of these
+    fingerprint = []
+    for sub in ("", "tools", "cmdline-tools", os.path.join("cmdline-tools", "latest")):
+        try:
+            fingerprint.append(os.stat(os.path.join(android_home, sub)).st_mtime_ns)
+        except OSError:
+            fingerprint.append(None)
+    return fingerprint
+
+def _subdirs(path):
+    """Return the lowercased names of the directories directly under path"""
+    try:
+        with os.scandir(path) as entries:
+            # DirEntry.is_dir() reuses the type info from the enumeration
+            return {entry.name.lower() for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
 class CordovaPathSetup:
     def __init__(self):
         self.android_home = os.environ.get('ANDROID_HOME') or os.environ.get('ANDROID_SDK_ROOT')
         self.required_paths = []
         self.missing_paths = []
         self.existing_paths = []
+        self._current_path_raw = None
+        self._current_path_type = None
+        self._current_paths_norm = None
+        self._env_changed = False
         
     def detect_android_sdk(self):
         """Detect Android SDK location"""
-        if self.android_home and Path(self.android_home).exists():
-            print(f"✓ Android SDK found at: {self.android_home}")
-            return True
+        # Listing the tool directories doubles as the existence check; a stale
+        # ANDROID_HOME/ANDROID_SDK_ROOT yields no paths and falls through to the search
+        if self.android_home:
+            if self.get_required_paths():
+                print(f"✓ Android SDK found at: {self.android_home}")
+                return True
+            print(f"⚠ No SDK tools under {self.android_home}, searching common locations...")
+            self.android_home = None
         
         # Common Android SDK locations
+        user_profile = os.environ.get('USERPROFILE') or os.path.expanduser('~')
         possible_locations = [
-            Path.home() / "AppData/Local/Android/Sdk",
-            Path("C:/Android/Sdk"),
-            Path("C:/Program Files/Android/Sdk"),
-            Path("C:/Program Files (x86)/Android/Sdk"),
+            os.path.join(user_profile, 'AppData', 'Local', 'Android', 'Sdk'),
+            "C:\\Android\\Sdk",
+            "C:\\Program Files\\Android\\Sdk",
+            "C:\\Program Files (x86)\\Android\\Sdk",
         ]
         
         for location in possible_locations:
-            if location.exists():
-                self.android_home = str(location)
+            if _fast_exists(location):
+                self.android_home = location
                 print(f"✓ Android SDK found at: {self.android_home}")
                 return True
         
@@ -49,44 +113,56 @@ class CordovaPathSetup:
         if not self.android_home:
             return []
         
-        base = Path(self.android_home)
+        # Plain string joins; no Path objects needed for known-clean suffixes
+        join = os.path.join
+        base = self.android_home
+        
+        # One directory listing per level instead of an exists() probe per path
+        top = _subdirs(base)
+        tools = _subdirs(join(base, "tools")) if "tools" in top else set()
+        cmdline_tools = _subdirs(join(base, "cmdline-tools")) if "cmdline-tools" in top else set()
+        latest = _subdirs(join(base, "cmdline-tools", "latest")) if "latest" in cmdline_tools else set()
         
         paths = [
-            base / "emulator",
-            base / "platform-tools",
-            base / "tools",
-            base / "tools/bin",
-            base / "cmdline-tools/latest/bin",
+            (join(base, "emulator"), "emulator" in top),
+            (join(base, "platform-tools"), "platform-tools" in top),
+            (join(base, "tools"), "tools" in top),
+            (join(base, "tools", "bin"), "bin" in tools),
+            (join(base, "cmdline-tools", "latest", "bin"), "bin" in latest),
         ]
         
         # Filter only existing paths
-        self.required_paths = [str(p) for p in paths if p.exists()]
+        self.required_paths = [p for p, exists in paths if exists]
         return self.required_paths
     
-    def get_current_user_path(self):
-        """Get current user PATH from registry"""
-        try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0, winreg.KEY_READ) as key:
-                path_value, _ = winreg.QueryValueEx(key, 'Path')
-                return path_value
-        except WindowsError:
-            return ""
+    def get_current_user_path(self, key):
+        """Get current user PATH from the open HKCU\\Environment key"""
+        if self._current_path_raw is None:
+            try:
+                path_value, value_type = winreg.QueryValueEx(key, 'Path')
+                self._current_path_raw = path_value
+                self._current_path_type = value_type
+            except WindowsError:
+                self._current_path_raw = ""
+                self._current_path_type = None
+        return self._current_path_raw
     
-    def check_paths(self):
+    def check_paths(self, key):
         """Check which paths are missing from user PATH"""
-        current_path = self.get_current_user_path()
+        current_path = self.get_current_user_path(key)
         current_paths = [p.strip() for p in current_path.split(';') if p.strip()]
+        current_norm = frozenset(os.path.normpath(p).lower() for p in current_paths)
+        self._current_paths_norm = current_norm
         
         print("\n" + "="*70)
         print("CHECKING REQUIRED PATHS")
         print("="*70)
         
-        for required_path in self.required_paths:
-            # Normalize paths for comparison
-            normalized_required = os.path.normpath(required_path).lower()
-            found = any(os.path.normpath(p).lower() == normalized_required for p in current_paths)
-            
-            if found:
+        # Normalize paths for comparison
+        normalized_required = [os.path.normpath(p).lower() for p in self.required_paths]
+        
+        for required_path, normalized in zip(self.required_paths, normalized_required):
+            if normalized in current_norm:
                 print(f"✓ {required_path}")
                 self.existing_paths.append(required_path)
             else:
@@ -95,7 +171,7 @@ class CordovaPathSetup:
         
         return len(self.missing_paths) == 0
     
-    def add_paths_to_user_path(self):
+    def add_paths_to_user_path(self, key):
         """Permanently add missing paths to user PATH"""
         if not self.missing_paths:
             print("\n✓ All required paths are already in your PATH!")
@@ -106,22 +182,46 @@ class CordovaPathSetup:
         print("="*70)
         
         try:
-            current_path = self.get_current_user_path()
-            new_paths = self.missing_paths
+            # Reuse the PATH check_paths already read and parsed
+            current_path = self._current_path_raw
+            if current_path is None or self._current_paths_norm is None:
+                current_path = self.get_current_user_path(key)
+                self._current_paths_norm = frozenset(os.path.normpath(p.strip()).lower() for p in current_path.split(';') if p.strip())
+            
+            # Canonicalize and skip anything already on PATH or repeated in missing_paths;
+            # every duplicate PATH entry slows down future process launches
+            seen = set(self._current_paths_norm)
+            new_paths = []
+            for path in self.missing_paths:
+                path = os.path.normpath(path)
+                normalized = path.lower()
+                if normalized not in seen:
+                    seen.add(normalized)
+                    new_paths.append(path)
+            
+            if not new_paths:
+                print("\n✓ All required paths are already in your PATH!")
+                return True
+            
+            # Combine existing and new paths in a single join
+            parts = [current_path.rstrip(';')] if current_path else []
+            parts.extend(new_paths)
+            new_path_value = ';'.join(parts)
             
-            # Combine existing and new paths
-            if current_path:
-                new_path_value = current_path.rstrip(';') + ';' + ';'.join(new_paths)
+            # REG_EXPAND_SZ only when something needs expanding (or it already was one)
+            if '%' in new_path_value or self._current_path_type == winreg.REG_EXPAND_SZ:
+                value_type = winreg.REG_EXPAND_SZ
             else:
-                new_path_value = ';'.join(new_paths)
+                value_type = winreg.REG_SZ
             
             # Write to registry
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0, 
-                               winreg.KEY_SET_VALUE) as key:
-                winreg.SetValueEx(key, 'Path', 0, winreg.REG_EXPAND_SZ, new_path_value)
+            winreg.SetValueEx(key, 'Path', 0, value_type, new_path_value)
             
-            # Broadcast environment change
-            self.broadcast_environment_change()
+            # The cached PATH is stale now
+            self._current_path_raw = None
+            self._current_path_type = None
+            self._current_paths_norm = None
+            self._env_changed = True
             
             for path in new_paths:
                 print(f"✓ Added: {path}")
@@ -141,22 +241,70 @@ class CordovaPathSetup:
     
     def broadcast_environment_change(self):
         """Notify Windows of environment variable changes"""
-        try:
-            import win32gui
-            import win32con
-            win32gui.SendMessageTimeout(
-                win32con.HWND_BROADCAST,
-                win32con.WM_SETTINGCHANGE,
-                0,
-                'Environment',
-                win32con.SMTO_ABORTIFHUNG,
-                5000
-            )
-        except ImportError:
+        if win32gui is None:
             # win32gui not available, changes will apply after restart
-            pass
+            return
+        win32gui.SendMessageTimeout(
+            win32con.HWND_BROADCAST,
+            win32con.WM_SETTINGCHANGE,
+            0,
+            'Environment',
+            win32con.SMTO_ABORTIFHUNG,
+            1000
+        )
+    
+    def _probe_one(self, cmd):
+        """Run '<cmd> --version' and return the status line to print"""
+        import subprocess
+        # Resolve once and exec the absolute path; nothing to spawn if it's not on PATH
+        exe = shutil.which(cmd)
+        if exe is None:
+            return f"✗ {cmd} not found (restart terminal needed)"
+        
+        # Don't allocate or flash a console window for the probe
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        
+        try:
+            proc = subprocess.Popen([exe, '--version'],
+                                    stdout=subprocess.PIPE,
+                                    stderr=subprocess.PIPE,
+                                    text=True,
+                                    creationflags=subprocess.CREATE_NO_WINDOW,
+                                    startupinfo=startupinfo)
+        except FileNotFoundError:
+            return f"✗ {cmd} not found (restart terminal needed)"
+        except Exception as e:
+            return f"✗ {cmd} error: {e}"
+        
+        try:
+            # --version answers in well under a second on a healthy machine
+            stdout, stderr = proc.communicate(timeout=2)
+        except subprocess.TimeoutExpired:
+            # The .bat wrappers leave a JVM behind; kill the whole process tree
+            subprocess.run(['taskkill', '/T', '/F', '/PID', str(proc.pid)],
+                           capture_output=True,
+                           creationflags=subprocess.CREATE_NO_WINDOW)
+            proc.kill()
+            proc.communicate()
+            return f"⚠ {cmd} timed out"
+        
+        if proc.returncode == 0 or 'version' in stdout.lower() or 'version' in stderr.lower():
+            return f"✓ {cmd} is accessible"
+        else:
+            return f"⚠ {cmd} exists but may not be working properly"
     
-    def verify_commands(self):
+    def _fast_verify(self, commands):
+        """Check that each command resolves on PATH without running it"""
+        for cmd in commands:
+            exe = shutil.which(cmd)
+            if exe:
+                print(f"✓ {cmd} is accessible ({exe})")
+            else:
+                print(f"✗ {cmd} not found (restart terminal needed)")
+    
+    def verify_commands(self, deep=False):
         """Verify that commands are accessible"""
         print("\n" + "="*70)
         print("VERIFYING COMMANDS")
@@ -164,24 +312,21 @@ class CordovaPathSetup:
         
         commands = ['adb', 'emulator', 'avdmanager', 'sdkmanager']
         
-        for cmd in commands:
-            try:
-                result = subprocess.run([cmd, '--version'], 
-                                      capture_output=True, 
-                                      timeout=5,
-                                      text=True)
-                if result.returncode == 0 or 'version' in result.stdout.lower() or 'version' in result.stderr.lower():
-                    print(f"✓ {cmd} is accessible")
-                else:
-                    print(f"⚠ {cmd} exists but may not be working properly")
-            except FileNotFoundError:
-                print(f"✗ {cmd} not found (restart terminal needed)")
-            except subprocess.TimeoutExpired:
-                print(f"⚠ {cmd} timed out")
-            except Exception as e:
-                print(f"✗ {cmd} error: {e}")
+        # A PATH lookup is enough to tell whether the tools are reachable;
+        # running them (JVM startup for the SDK managers) is opt-in
+        if not deep:
+            self._fast_verify(commands)
+            return
+        
+        # The probes are independent; run them together and print in order
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(self._probe_one, commands))
+        
+        for line in results:
+            print(line)
     
-    def check_android_home_env(self):
+    def check_android_home_env(self, key):
         """Check and suggest ANDROID_HOME environment variable"""
         print("\n" + "="*70)
         print("CHECKING ENVIRONMENT VARIABLES")
@@ -194,41 +339,68 @@ class CordovaPathSetup:
             print(f"✓ ANDROID_HOME: {android_home}")
         else:
             print(f"✗ ANDROID_HOME not set")
-            self.set_android_home_env()
+            self.set_android_home_env(key)
         
         if android_sdk_root:
             print(f"⚠ ANDROID_SDK_ROOT: {android_sdk_root} (DEPRECATED)")
     
-    def set_android_home_env(self):
+    def set_android_home_env(self, key):
         """Set ANDROID_HOME environment variable"""
         if not self.android_home:
             return
         
         try:
-            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0, 
-                               winreg.KEY_SET_VALUE) as key:
-                winreg.SetValueEx(key, 'ANDROID_HOME', 0, winreg.REG_SZ, self.android_home)
+            winreg.SetValueEx(key, 'ANDROID_HOME', 0, winreg.REG_SZ, self.android_home)
+            self._env_changed = True
             print(f"✓ Set ANDROID_HOME to: {self.android_home}")
         except Exception as e:
             print(f"✗ Could not set ANDROID_HOME: {e}")
     
-    def run(self):
-        """Main execution flow"""
-        print("="*70)
-        print("CORDOVA ANDROID PATH SETUP HELPER")
-        print("="*70)
-        print("\nThis script will check and add required Android SDK paths")
-        print("to your Windows user PATH environment variable.\n")
+    def state_matches(self, key):
+        """Check whether the saved state from the last successful run still applies"""
+        if not self.android_home:
+            return False
+        try:
+            with open(STATE_FILE, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+        
+        if state.get('android_home') != self.android_home:
+            return False
+        if state.get('path_hash') != _path_hash(self.get_current_user_path(key)):
+            return False
+        if state.get('sdk_fingerprint') != _sdk_fingerprint(self.android_home):
+            return False
         
+        self.required_paths = state.get('required_paths', [])
+        return True
+    
+    def save_state(self, key):
+        """Record the SDK location and PATH fingerprint of a successful run"""
+        state = {
+            'android_home': self.android_home,
+            'required_paths': self.required_paths,
+            'path_hash': _path_hash(self.get_current_user_path(key)),
+            'sdk_fingerprint': _sdk_fingerprint(self.android_home),
+        }
+        try:
+            STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(STATE_FILE, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except OSError:
+            # The cache is only an optimization
+            pass
+    
+    def configure_paths(self, key):
+        """Detect the SDK and add any missing tool directories to PATH"""
         # Step 1: Detect Android SDK
         if not self.detect_android_sdk():
             return False
         
-        # Step 2: Check ANDROID_HOME
-        self.check_android_home_env()
-        
-        # Step 3: Get required paths
-        self.get_required_paths()
+        # Step 2: Get required paths (already listed if the SDK came from the environment)
+        if not self.required_paths:
+            self.get_required_paths()
         
         if not self.required_paths:
             print("\n✗ No valid Android SDK paths found!")
@@ -236,8 +408,11 @@ class CordovaPathSetup:
         
         print(f"\nFound {len(self.required_paths)} required path(s)")
         
+        # Step 3: Check ANDROID_HOME; only a root that produced paths is worth persisting
+        self.check_android_home_env(key)
+        
         # Step 4: Check which paths are missing
-        all_present = self.check_paths()
+        all_present = self.check_paths(key)
         
         # Step 5: Add missing paths
         if not all_present:
@@ -245,13 +420,45 @@ class CordovaPathSetup:
             response = input().strip().lower()
             
             if response == 'y':
-                self.add_paths_to_user_path()
+                if self.add_paths_to_user_path(key):
+                    self.save_state(key)
             else:
                 print("\n✗ Aborted. No changes were made.")
                 return False
+        else:
+            self.save_state(key)
+        
+        return True
+    
+    def run(self, deep_verify=False, use_cache=True):
+        """Main execution flow"""
+        print("="*70)
+        print("CORDOVA ANDROID PATH SETUP HELPER")
+        print("="*70)
+        print("\nThis script will check and add required Android SDK paths")
+        print("to your Windows user PATH environment variable.\n")
+        
+        # One registry session for every read and write below
+        try:
+            key = winreg.OpenKey(winreg.HKEY_CURRENT_USER, 'Environment', 0,
+                                 winreg.KEY_READ | winreg.KEY_SET_VALUE)
+        except OSError as e:
+            print(f"\n✗ Could not open HKCU\\Environment: {e}")
+            return False
+        
+        with key:
+            # Re-runs with the same SDK and an untouched PATH skip all probing
+            if use_cache and self.state_matches(key):
+                print(f"✓ Cache hit: PATH unchanged since the last successful run for {self.android_home}")
+            elif not self.configure_paths(key):
+                return False
+        
+        # Broadcasting waits on every top-level window, so only do it after a write
+        if self._env_changed:
+            self.broadcast_environment_change()
         
         # Step 6: Verify commands (will fail if terminal not restarted)
-        self.verify_commands()
+        self.verify_commands(deep=deep_verify)
         
         print("\n" + "="*70)
         print("NEXT STEPS")
@@ -268,7 +475,14 @@ if __name__ == "__main__":
         print("This script is designed for Windows only.")
         sys.exit(1)
     
+    parser = argparse.ArgumentParser(description='Add the Android SDK tools to the Windows user PATH')
+    parser.add_argument('--deep-verify', action='store_true',
+                        help="run each tool with --version instead of only checking it is on PATH")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore the saved state from the last run and re-check the SDK")
+    args = parser.parse_args()
+    
     setup = CordovaPathSetup()
-    success = setup.run()
+    success = setup.run(deep_verify=args.deep_verify, use_cache=not args.no_cache)
     
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -20,12 +20,18 @@ import sys
 import os
 import platform
 import re
+import json
+import hashlib
+import shutil
 import threading
 import time
 import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
+from types import MappingProxyType
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 
 # Color codes for terminal output
 class Colors:
@@ -47,9 +53,18 @@ class Colors:
         Colors.CYAN = ''
         Colors.BOLD = ''
         Colors.RESET = ''
+        try:
+            AuditResult.refresh_status_strings()
+        except NameError:
+            # Import-time disable: AuditResult picks up the blank colors when it is defined
+            pass
+
+# Resolved once; platform.system() goes through uname() on every call
+_SYSTEM = platform.system()
+_IS_WINDOWS = _SYSTEM == 'Windows'
 
 # Check if terminal supports colors
-if platform.system() == 'Windows':
+if _IS_WINDOWS:
     try:
         import ctypes
         kernel32 = ctypes.windll.kernel32
@@ -57,36 +72,195 @@ if platform.system() == 'Windows':
     except:
         Colors.disable()
 
+# One pattern for every tool's version banner, compiled once at import;
+# add a named group here to parse a new tool
+_VERSION_RE = re.compile(
+    r'(?:version "(?P<java>\d+\.\d+\.\d+))'
+    r'|(?:Gradle (?P<gradle>\d+\.\d+))'
+    r'|(?:v(?P<node>\d+\.\d+\.\d+))'
+)
+
+def _parse_version(output: str, tool: str) -> Optional[str]:
+    """Return the first version in output matched by the named group for tool"""
+    for match in _VERSION_RE.finditer(output):
+        if match.group(tool):
+            return match.group(tool)
+    return None
+
+# Report section separators
+_SEP_EQ = '=' * 80 + '\n'
+_SEP_DASH = '-' * 80 + '\n'
+
+# Serializes spinner frames and debug logging from concurrent checks
+_STDOUT_LOCK = threading.Lock()
+
 class ProgressSpinner:
-    """Animated progress spinner for long-running operations"""
+    """Progress spinner animated inline by the thread waiting on the work; use the shared GLOBAL_SPINNER"""
     def __init__(self, message="Processing"):
         self.spinner = ['|', '/', '-', '\\']
         self.idx = 0
         self.message = message
-        self.running = False
-        self.thread = None
-        
-    def spin(self):
-        while self.running:
-            sys.stdout.write(f'\r{Colors.CYAN}[{self.spinner[self.idx]}]{Colors.RESET} {self.message}...')
+        self.width = 0
+        # Frames are just noise in redirected output
+        self.enabled = sys.stdout is not None and sys.stdout.isatty()
+    
+    def set_message(self, message: str):
+        self.message = message
+    
+    def tick(self):
+        """Draw the next frame"""
+        if not self.enabled:
+            return
+        # Pad so a shorter message fully overwrites the previous one
+        self.width = max(self.width, len(self.message))
+        with _STDOUT_LOCK:
+            sys.stdout.write(f'\r{Colors.CYAN}[{self.spinner[self.idx]}]{Colors.RESET} {self.message.ljust(self.width)}...')
             sys.stdout.flush()
-            self.idx = (self.idx + 1) % len(self.spinner)
-            time.sleep(0.1)
-        sys.stdout.write('\r' + ' ' * (len(self.message) + 10) + '\r')
-        sys.stdout.flush()
+        self.idx = (self.idx + 1) % len(self.spinner)
     
     def start(self):
-        self.running = True
-        self.thread = threading.Thread(target=self.spin)
-        self.thread.start()
+        self.tick()
     
     def stop(self):
-        self.running = False
-        if self.thread:
-            self.thread.join()
+        if not (self.enabled and self.width):
+            return
+        with _STDOUT_LOCK:
+            sys.stdout.write('\r' + ' ' * (self.width + 10) + '\r')
+            sys.stdout.flush()
+        self.width = 0
+
+GLOBAL_SPINNER = ProgressSpinner()
+
+def _scan_names(directory: str) -> Optional[frozenset]:
+    """Entry names in directory from a single scandir (lowercased on Windows), or None if unreadable"""
+    try:
+        with os.scandir(directory) as entries:
+            if _IS_WINDOWS:
+                return frozenset(entry.name.lower() for entry in entries)
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return None
+
+def _component_exists(root: str, component: str, listings: Dict[str, Optional[frozenset]]) -> bool:
+    """Check a '/'-separated component under root against directory listings, scanning levels lazily"""
+    directory = root
+    for part in component.split('/'):
+        if directory not in listings:
+            listings[directory] = _scan_names(directory)
+        names = listings[directory]
+        if not names or (part.lower() if _IS_WINDOWS else part) not in names:
+            return False
+        directory = os.path.join(directory, part)
+    return True
+
+def _first_existing(paths: List[Path]) -> Optional[Path]:
+    """Stat all candidate paths concurrently and return the first existing one in priority order"""
+    if not paths:
+        return None
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        for path, exists in zip(paths, executor.map(Path.exists, paths)):
+            if exists:
+                return path
+    return None
+
+def _cordova_package_version(cordova_exe: str) -> Optional[str]:
+    """Read the version from the package.json of the cordova install behind cordova_exe"""
+    # Unix: bin/cordova links into .../node_modules/cordova/bin/cordova
+    # Windows: npm\cordova.cmd sits next to npm\node_modules\cordova
+    candidates = [os.path.join(os.path.dirname(cordova_exe), 'node_modules', 'cordova')]
+    directory = os.path.dirname(os.path.realpath(cordova_exe))
+    while True:
+        parent = os.path.dirname(directory)
+        if os.path.basename(directory) == 'cordova' and os.path.basename(parent) == 'node_modules':
+            candidates.insert(0, directory)
+            break
+        if parent == directory:
+            break
+        directory = parent
+    
+    for package_dir in candidates:
+        try:
+            with open(os.path.join(package_dir, 'package.json'), 'r', encoding='utf-8') as f:
+                version = json.load(f).get('version')
+        except (OSError, ValueError, AttributeError):
+            continue
+        if version:
+            return version
+    return None
+
+VERSION_CACHE_FILE = Path.home() / '.cache' / 'smartchat_audit' / 'versions.json'
+
+# Variables that can change which real binary a launcher runs (e.g. the macOS java stub
+# follows JAVA_HOME); part of every cache key
+_CACHE_ENV_VARS = ('JAVA_HOME', 'PATH')
+
+def _is_shim(exe: str, real: str) -> bool:
+    """True for version-manager shims and OS stubs that pick the real tool at run time"""
+    # jenv/asdf/pyenv-style shims can also select by .tool-versions etc. in the
+    # working directory, which no key can capture
+    if os.path.basename(os.path.dirname(exe)) == 'shims':
+        return True
+    if os.path.splitext(os.path.basename(real))[0].lower() == 'volta-shim':
+        return True
+    # The macOS /usr/bin/java stub picks the newest installed JDK when JAVA_HOME is unset
+    return sys.platform == 'darwin' and real.startswith('/usr/bin/')
+
+class _VersionCache:
+    """On-disk memo of version probe output keyed by executable path, mtime and size"""
+    def __init__(self, path: Path = VERSION_CACHE_FILE, enabled: bool = True):
+        self.path = path
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[str, list] = {}
+        if enabled:
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError):
+                self._entries = {}
+    
+    @staticmethod
+    def key_for(exe: str, args: List[str], getenv: Callable[[str], Optional[str]]) -> Optional[str]:
+        """Identify a command by its resolved executable and environment; None if it shouldn't be cached"""
+        try:
+            real = os.path.realpath(exe)
+            st = os.stat(real)
+        except OSError:
+            return None
+        if _is_shim(exe, real):
+            return None
+        env = '\0'.join(f"{var}={getenv(var) or ''}" for var in _CACHE_ENV_VARS)
+        env_hash = hashlib.blake2b(env.encode('utf-8'), digest_size=16).hexdigest()
+        return f"{real}|{st.st_mtime_ns}|{st.st_size}|{env_hash}|{' '.join(args)}"
+    
+    def get(self, key: str) -> Optional[Tuple[bool, str, str]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        return tuple(entry) if entry else None
+    
+    def put(self, key: str, value: Tuple[bool, str, str]):
+        with self._lock:
+            self._entries[key] = list(value)
+            self._dirty = True
+    
+    def save(self):
+        """Write the cache back to disk if anything changed"""
+        if not (self.enabled and self._dirty):
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self._entries, f)
+            self._dirty = False
+        except OSError:
+            # The cache is only an optimization
+            pass
 
 class AuditResult:
     """Store result of a single audit check"""
+    __slots__ = ('name', 'passed', 'details', 'warning', 'fix_suggestion')
+    
     def __init__(self, name: str, passed: bool, details: str = "", 
                  warning: bool = False, fix_suggestion: str = ""):
         self.name = name
@@ -95,47 +269,104 @@ class AuditResult:
         self.warning = warning
         self.fix_suggestion = fix_suggestion
     
+    @classmethod
+    def refresh_status_strings(cls):
+        """Rebuild the colored status strings from the current Colors, indexed fail/pass/warning"""
+        cls._SYMBOLS = (f"{Colors.RED}✗{Colors.RESET}", f"{Colors.GREEN}✓{Colors.RESET}", f"{Colors.YELLOW}⚠{Colors.RESET}")
+        cls._TEXTS = (f"{Colors.RED}FAIL{Colors.RESET}", f"{Colors.GREEN}PASS{Colors.RESET}", f"{Colors.YELLOW}WARNING{Colors.RESET}")
+    
     def status_symbol(self) -> str:
-        if self.warning:
-            return f"{Colors.YELLOW}⚠{Colors.RESET}"
-        return f"{Colors.GREEN}✓{Colors.RESET}" if self.passed else f"{Colors.RED}✗{Colors.RESET}"
+        return self._SYMBOLS[2 if self.warning else int(self.passed)]
     
     def status_text(self) -> str:
-        if self.warning:
-            return f"{Colors.YELLOW}WARNING{Colors.RESET}"
-        return f"{Colors.GREEN}PASS{Colors.RESET}" if self.passed else f"{Colors.RED}FAIL{Colors.RESET}"
+        return self._TEXTS[2 if self.warning else int(self.passed)]
+
+AuditResult.refresh_status_strings()
 
 class SystemAuditor:
     """Main audit system for checking development environment"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, use_cache: bool = True):
         self.verbose = verbose
+        self._version_cache = _VersionCache(enabled=use_cache)
+        self._which: Dict[str, Optional[str]] = {}
         self.results: List[AuditResult] = []
         self.start_time = time.time()
+        # Read-only snapshot so checks see one consistent environment
+        self._env = MappingProxyType(dict(os.environ))
         self.system_info = {
-            'os': platform.system(),
+            'os': _SYSTEM,
             'os_version': platform.version(),
             'architecture': platform.machine(),
             'python_version': platform.python_version()
         }
+        # Tokenize PATH once; Windows matches case-insensitively
+        self._path_entries = {
+            os.path.normpath(p) for p in self._getenv('PATH', '').split(os.pathsep) if p
+        }
+        self._path_entries_ci = {p.lower() for p in self._path_entries}
+    
+    def _getenv(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Look up name in the environment snapshot"""
+        # Windows environment keys are stored uppercased, as os.environ does
+        return self._env.get(name.upper() if _IS_WINDOWS else name, default)
+    
+    def _resolve(self, exe: str) -> Optional[str]:
+        """shutil.which, memoized for the lifetime of the auditor"""
+        if exe not in self._which:
+            self._which[exe] = shutil.which(exe, path=self._getenv('PATH'))
+        return self._which[exe]
+    
+    def _env_paths(self, candidates: List[Tuple[str, Tuple[str, ...]]]) -> List[Path]:
+        """Build candidate paths from (variable, parts) pairs, skipping variables that are unset or empty"""
+        paths = []
+        for var, parts in candidates:
+            base = self._getenv(var)
+            if base:
+                paths.append(Path(base).joinpath(*parts))
+        return paths
     
     def log(self, message: str):
         """Log verbose messages"""
         if self.verbose:
-            print(f"{Colors.BLUE}[DEBUG]{Colors.RESET} {message}")
+            # Checks log from worker threads
+            with _STDOUT_LOCK:
+                print(f"{Colors.BLUE}[DEBUG]{Colors.RESET} {message}")
     
-    def run_command(self, cmd: List[str], timeout: int = 10) -> Tuple[bool, str, str]:
+    def run_command(self, cmd: List[str], timeout: int = 10, cache: bool = False) -> Tuple[bool, str, str]:
         """Execute system command and return success status and output"""
+        # Version probes of an unchanged executable can be answered from the cache
+        cache_key = None
+        if cache and self._version_cache.enabled:
+            exe = self._resolve(cmd[0])
+            cache_key = self._version_cache.key_for(exe, cmd[1:], self._getenv) if exe else None
+            if cache_key:
+                cached = self._version_cache.get(cache_key)
+                if cached:
+                    self.log(f"Cache hit: {' '.join(cmd)}")
+                    return cached
+        
+        output = self._spawn(cmd, timeout)
+        if cache_key and output[0]:
+            self._version_cache.put(cache_key, output)
+        return output
+    
+    def _spawn(self, cmd: List[str], timeout: int) -> Tuple[bool, str, str]:
+        """Run cmd in a subprocess"""
         try:
             self.log(f"Running command: {' '.join(cmd)}")
             result = subprocess.run(
                 cmd,
                 capture_output=True,
-                text=True,
                 timeout=timeout,
                 shell=False
             )
-            return (result.returncode == 0, result.stdout.strip(), result.stderr.strip())
+            # Version banners are tiny; decode the finished bytes in one go
+            return (
+                result.returncode == 0,
+                result.stdout.decode('utf-8', 'replace').strip(),
+                result.stderr.decode('utf-8', 'replace').strip()
+            )
         except subprocess.TimeoutExpired:
             return (False, "", f"Command timed out after {timeout} seconds")
         except FileNotFoundError:
@@ -145,26 +376,26 @@ class SystemAuditor:
     
     def check_java(self) -> AuditResult:
         """Check OpenJDK 17.0.17 installation"""
-        spinner = ProgressSpinner("Checking Java Development Kit")
-        spinner.start()
+        not_installed = AuditResult(
+            "OpenJDK 17.0.17",
+            False,
+            "Not installed",
+            fix_suggestion="Download and install OpenJDK 17.0.17 from https://adoptium.net/"
+        )
         
-        success, stdout, stderr = self.run_command(['java', '-version'])
-        spinner.stop()
+        # A PATH walk is far cheaper than a failed process spawn
+        if not self._resolve('java'):
+            return not_installed
         
+        success, stdout, stderr = self.run_command(['java', '-version'], cache=True)
         if not success:
-            return AuditResult(
-                "OpenJDK 17.0.17",
-                False,
-                "Not installed",
-                fix_suggestion="Download and install OpenJDK 17.0.17 from https://adoptium.net/"
-            )
+            return not_installed
         
         # Parse Java version from stderr (Java outputs version to stderr)
         version_output = stderr if stderr else stdout
-        version_match = re.search(r'version "(\d+\.\d+\.\d+)', version_output)
+        version = _parse_version(version_output, 'java')
         
-        if version_match:
-            version = version_match.group(1)
+        if version:
             major_version = int(version.split('.')[0])
             
             if major_version == 17:
@@ -182,35 +413,39 @@ class SystemAuditor:
     
     def check_cordova(self) -> AuditResult:
         """Check Cordova installation"""
-        spinner = ProgressSpinner("Checking Cordova")
-        spinner.start()
+        not_installed = AuditResult(
+            "Cordova (latest)",
+            False,
+            "Not installed",
+            fix_suggestion="Install Cordova: npm install -g cordova"
+        )
         
-        success, stdout, stderr = self.run_command(['cordova', '--version'])
-        spinner.stop()
+        cordova_exe = self._resolve('cordova')
+        if not cordova_exe:
+            return not_installed
         
+        # The installed package.json has the version without starting Node
+        version = _cordova_package_version(cordova_exe)
+        if version:
+            return AuditResult("Cordova (latest)", True, version)
+        
+        success, stdout, stderr = self.run_command(['cordova', '--version'], cache=True)
         if not success:
-            return AuditResult(
-                "Cordova (latest)",
-                False,
-                "Not installed",
-                fix_suggestion="Install Cordova: npm install -g cordova"
-            )
+            return not_installed
         
         version = stdout.strip()
         return AuditResult("Cordova (latest)", True, version)
     
     def check_android_studio(self) -> AuditResult:
         """Detect Android Studio installation"""
-        spinner = ProgressSpinner("Checking Android Studio")
-        spinner.start()
-        
         # Common Android Studio paths
-        if platform.system() == 'Windows':
-            common_paths = [
-                Path(os.environ.get('ProgramFiles', 'C:\\Program Files')) / 'Android' / 'Android Studio',
-                Path(os.environ.get('ProgramFiles(x86)', 'C:\\Program Files (x86)')) / 'Android' / 'Android Studio',
-                Path(os.environ.get('LOCALAPPDATA', '')) / 'Android' / 'Sdk'
-            ]
+        if _IS_WINDOWS:
+            # Only probe locations rooted at variables that are actually set
+            common_paths = self._env_paths([
+                ('ProgramFiles', ('Android', 'Android Studio')),
+                ('ProgramFiles(x86)', ('Android', 'Android Studio')),
+                ('LOCALAPPDATA', ('Android', 'Sdk')),
+            ])
         else:
             common_paths = [
                 Path.home() / 'Android' / 'Sdk',
@@ -218,11 +453,9 @@ class SystemAuditor:
                 Path('/opt/android-studio')
             ]
         
-        spinner.stop()
-        
-        for path in common_paths:
-            if path.exists():
-                return AuditResult("Android Studio", True, str(path))
+        path = _first_existing(common_paths)
+        if path:
+            return AuditResult("Android Studio", True, str(path))
         
         return AuditResult(
             "Android Studio",
@@ -233,34 +466,28 @@ class SystemAuditor:
     
     def check_android_sdk(self) -> Tuple[AuditResult, Optional[Path]]:
         """Locate Android SDK installation"""
-        spinner = ProgressSpinner("Checking Android SDK")
-        spinner.start()
-        
         # Check ANDROID_HOME or ANDROID_SDK_ROOT
-        sdk_path = os.environ.get('ANDROID_HOME') or os.environ.get('ANDROID_SDK_ROOT')
+        sdk_path = self._getenv('ANDROID_HOME') or self._getenv('ANDROID_SDK_ROOT')
         
         if sdk_path and Path(sdk_path).exists():
-            spinner.stop()
             return (AuditResult("Android SDK", True, sdk_path), Path(sdk_path))
         
         # Check common locations
-        if platform.system() == 'Windows':
-            common_paths = [
-                Path(os.environ.get('LOCALAPPDATA', '')) / 'Android' / 'Sdk',
-                Path(os.environ.get('USERPROFILE', '')) / 'AppData' / 'Local' / 'Android' / 'Sdk',
-            ]
+        if _IS_WINDOWS:
+            common_paths = self._env_paths([
+                ('LOCALAPPDATA', ('Android', 'Sdk')),
+                ('USERPROFILE', ('AppData', 'Local', 'Android', 'Sdk')),
+            ])
         else:
             common_paths = [
                 Path.home() / 'Android' / 'Sdk',
                 Path.home() / 'Library' / 'Android' / 'sdk',
             ]
         
-        for path in common_paths:
-            if path.exists():
-                spinner.stop()
-                return (AuditResult("Android SDK", True, str(path)), path)
+        path = _first_existing(common_paths)
+        if path:
+            return (AuditResult("Android SDK", True, str(path)), path)
         
-        spinner.stop()
         return (AuditResult(
             "Android SDK",
             False,
@@ -268,11 +495,12 @@ class SystemAuditor:
             fix_suggestion="Set ANDROID_HOME environment variable or install Android SDK"
         ), None)
     
-    def check_path_component(self, sdk_path: Path, component: str) -> AuditResult:
+    def check_path_component(self, sdk_path: Path, component: str,
+                             listings: Optional[Dict[str, Optional[frozenset]]] = None) -> AuditResult:
         """Check if SDK component is in PATH"""
         component_path = sdk_path / component
         
-        if not component_path.exists():
+        if not _component_exists(str(sdk_path), component, {} if listings is None else listings):
             return AuditResult(
                 f"PATH - {component}",
                 False,
@@ -280,10 +508,11 @@ class SystemAuditor:
                 fix_suggestion=f"Install missing SDK component: {component}"
             )
         
-        path_env = os.environ.get('PATH', '')
         path_str = str(component_path)
         
-        if path_str in path_env or str(component_path).lower() in path_env.lower():
+        if path_str in self._path_entries or (
+            _IS_WINDOWS and path_str.lower() in self._path_entries_ci
+        ):
             return AuditResult(f"PATH - {component}", True, "Found in PATH")
         
         return AuditResult(
@@ -293,23 +522,56 @@ class SystemAuditor:
             fix_suggestion=f"Add to PATH: {component_path}"
         )
     
+    def _avd_home(self) -> str:
+        """Resolve the AVD directory in the same order as the SDK tools"""
+        if self._getenv('ANDROID_AVD_HOME'):
+            return self._getenv('ANDROID_AVD_HOME')
+        for var, parts in (
+            ('ANDROID_EMULATOR_HOME', ('avd',)),
+            ('ANDROID_USER_HOME', ('avd',)),
+            ('ANDROID_SDK_HOME', ('.android', 'avd')),
+        ):
+            base = self._getenv(var)
+            if base:
+                return os.path.join(base, *parts)
+        return str(Path.home() / '.android' / 'avd')
+    
     def check_emulator(self, sdk_path: Path) -> AuditResult:
         """Check if Pixel_4 emulator exists"""
-        spinner = ProgressSpinner("Checking Pixel_4 Emulator")
-        spinner.start()
+        # AVDs are plain .ini files; listing their directory avoids starting avdmanager's JVM
+        avd_dir = self._avd_home()
+        try:
+            with os.scandir(avd_dir) as entries:
+                names = [entry.name for entry in entries]
+        except OSError:
+            names = None
+        
+        if names is not None:
+            if _IS_WINDOWS:
+                found = any(name.lower() == 'pixel_4.ini' for name in names)
+            else:
+                found = 'Pixel_4.ini' in names
+            if found:
+                return AuditResult("Pixel_4 Emulator", True, "Device configured")
+            return AuditResult(
+                "Pixel_4 Emulator",
+                False,
+                "Not found",
+                fix_suggestion="Create AVD: avdmanager create avd -n Pixel_4 -k \"system-images;android-30;google_apis;x86\""
+            )
         
+        # No AVD directory; ask avdmanager where they are
         avdmanager = sdk_path / 'cmdline-tools' / 'latest' / 'bin' / 'avdmanager'
-        if platform.system() == 'Windows':
+        if _IS_WINDOWS:
             avdmanager = Path(str(avdmanager) + '.bat')
         
         if not avdmanager.exists():
             # Try alternative path
             avdmanager = sdk_path / 'tools' / 'bin' / 'avdmanager'
-            if platform.system() == 'Windows':
+            if _IS_WINDOWS:
                 avdmanager = Path(str(avdmanager) + '.bat')
         
         if not avdmanager.exists():
-            spinner.stop()
             return AuditResult(
                 "Pixel_4 Emulator",
                 False,
@@ -318,7 +580,6 @@ class SystemAuditor:
             )
         
         success, stdout, stderr = self.run_command([str(avdmanager), 'list', 'avd'])
-        spinner.stop()
         
         if success and 'Pixel_4' in stdout:
             return AuditResult("Pixel_4 Emulator", True, "Device configured")
@@ -332,24 +593,23 @@ class SystemAuditor:
     
     def check_gradle(self, sdk_path: Path) -> AuditResult:
         """Check Gradle version"""
-        spinner = ProgressSpinner("Checking Gradle")
-        spinner.start()
+        not_installed = AuditResult(
+            "Gradle 8.13+",
+            False,
+            "Not installed or not in PATH",
+            warning=True,
+            fix_suggestion="Install Gradle 8.13+ or add to PATH"
+        )
         
-        success, stdout, stderr = self.run_command(['gradle', '--version'])
-        spinner.stop()
+        if not self._resolve('gradle'):
+            return not_installed
         
+        success, stdout, stderr = self.run_command(['gradle', '--version'], cache=True)
         if not success:
-            return AuditResult(
-                "Gradle 8.13+",
-                False,
-                "Not installed or not in PATH",
-                warning=True,
-                fix_suggestion="Install Gradle 8.13+ or add to PATH"
-            )
+            return not_installed
         
-        version_match = re.search(r'Gradle (\d+\.\d+)', stdout)
-        if version_match:
-            version = version_match.group(1)
+        version = _parse_version(stdout, 'gradle')
+        if version:
             version_num = float(version)
             
             if version_num >= 8.13:
@@ -377,22 +637,22 @@ class SystemAuditor:
     
     def check_nodejs(self) -> AuditResult:
         """Check Node.js installation"""
-        spinner = ProgressSpinner("Checking Node.js")
-        spinner.start()
+        not_installed = AuditResult(
+            "Node.js",
+            False,
+            "Not installed",
+            fix_suggestion="Download and install Node.js from https://nodejs.org/"
+        )
         
-        success, stdout, stderr = self.run_command(['node', '--version'])
-        spinner.stop()
+        if not self._resolve('node'):
+            return not_installed
         
+        success, stdout, stderr = self.run_command(['node', '--version'], cache=True)
         if not success:
-            return AuditResult(
-                "Node.js",
-                False,
-                "Not installed",
-                fix_suggestion="Download and install Node.js from https://nodejs.org/"
-            )
+            return not_installed
         
-        version = stdout.strip()
-        return AuditResult("Node.js", True, version)
+        version = _parse_version(stdout, 'node')
+        return AuditResult("Node.js", True, f"v{version}" if version else stdout.strip())
     
     def check_python(self) -> AuditResult:
         """Check Python 3.x installation"""
@@ -408,26 +668,42 @@ class SystemAuditor:
             fix_suggestion="Install Python 3.x from https://www.python.org/"
         )
     
+    def _run_parallel(self, checks: List[Callable]) -> list:
+        """Run independent checks concurrently, returning results in submission order"""
+        results: list = [None] * len(checks)
+        # Every check is I/O-bound (subprocesses, stats), so threads are enough. A future
+        # CPU-heavy check would need a ProcessPoolExecutor, and therefore a module-level
+        # function with picklable arguments: bound SystemAuditor methods can't be pickled
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {executor.submit(check): index for index, check in enumerate(checks)}
+            pending = set(futures)
+            # This thread would otherwise sit idle, so it animates the spinner
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[futures[future]] = future.result()
+                GLOBAL_SPINNER.tick()
+        return results
+    
     def run_audit(self) -> List[AuditResult]:
         """Run all audit checks"""
         print(f"\n{Colors.BOLD}{Colors.CYAN}SmartChat System Audit v1.0{Colors.RESET}")
         print(f"{Colors.CYAN}{'=' * 60}{Colors.RESET}\n")
         
-        # Java check
-        self.results.append(self.check_java())
-        
-        # Cordova check
-        self.results.append(self.check_cordova())
-        
-        # Android Studio check
-        self.results.append(self.check_android_studio())
-        
-        # Android SDK check
-        sdk_result, sdk_path = self.check_android_sdk()
-        self.results.append(sdk_result)
-        
-        # PATH and emulator checks (only if SDK found)
-        if sdk_path:
+        # Independent checks spend their time blocked on external tools, so
+        # overlap them; one shared spinner since per-check ones would clobber stdout
+        GLOBAL_SPINNER.set_message("Running system checks")
+        GLOBAL_SPINNER.start()
+        try:
+            java, cordova, studio, (sdk_result, sdk_path), nodejs, python = self._run_parallel([
+                self.check_java,
+                self.check_cordova,
+                self.check_android_studio,
+                self.check_android_sdk,
+                self.check_nodejs,
+                self.check_python,
+            ])
+            
             path_components = [
                 'emulator',
                 'platform-tools',
@@ -436,44 +712,52 @@ class SystemAuditor:
                 'cmdline-tools/latest/bin'
             ]
             
-            for component in path_components:
-                self.results.append(self.check_path_component(sdk_path, component))
-            
-            self.results.append(self.check_emulator(sdk_path))
-            self.results.append(self.check_gradle(sdk_path))
-        else:
-            # Mark PATH checks as failed if no SDK
-            for component in ['emulator', 'platform-tools', 'tools', 'tools/bin', 'cmdline-tools/latest/bin']:
-                self.results.append(AuditResult(
-                    f"PATH - {component}",
-                    False,
-                    "SDK not found"
-                ))
+            # PATH and emulator checks (only if SDK found) form a second wave
+            if sdk_path:
+                GLOBAL_SPINNER.set_message("Checking Android SDK components")
+                # One listing of the SDK root serves every component check
+                listings = {str(sdk_path): _scan_names(str(sdk_path))}
+                sdk_checks = self._run_parallel(
+                    [partial(self.check_path_component, sdk_path, component, listings) for component in path_components]
+                    + [partial(self.check_emulator, sdk_path), partial(self.check_gradle, sdk_path)]
+                )
+            else:
+                # Mark PATH checks as failed if no SDK
+                sdk_checks = [
+                    AuditResult(f"PATH - {component}", False, "SDK not found")
+                    for component in path_components
+                ]
+        finally:
+            GLOBAL_SPINNER.stop()
+        
+        self.results.extend([java, cordova, studio, sdk_result])
+        self.results.extend(sdk_checks)
         
         # SDK version config info
         self.results.append(self.check_sdk_version_config())
         
-        # Node.js check
-        self.results.append(self.check_nodejs())
+        self.results.extend([nodejs, python])
         
-        # Python check
-        self.results.append(self.check_python())
+        self._version_cache.save()
         
         return self.results
     
     def print_results(self):
         """Print formatted audit results"""
-        print(f"\n{Colors.BOLD}AUDIT RESULTS{Colors.RESET}")
-        print(f"{Colors.CYAN}{'-' * 80}{Colors.RESET}")
-        print(f"{Colors.BOLD}{'REQUIREMENT':<30} {'STATUS':<15} {'DETAILS':<35}{Colors.RESET}")
-        print(f"{Colors.CYAN}{'-' * 80}{Colors.RESET}")
+        separator = f"{Colors.CYAN}{'-' * 80}{Colors.RESET}"
+        lines = [
+            f"\n{Colors.BOLD}AUDIT RESULTS{Colors.RESET}",
+            separator,
+            f"{Colors.BOLD}{'REQUIREMENT':<30} {'STATUS':<15} {'DETAILS':<35}{Colors.RESET}",
+            separator,
+        ]
         
         for result in self.results:
             status = result.status_symbol()
             details = result.details[:35] + '...' if len(result.details) > 35 else result.details
-            print(f"{result.name:<30} {status:<20} {details:<35}")
+            lines.append(f"{result.name:<30} {status:<20} {details:<35}")
         
-        print(f"{Colors.CYAN}{'-' * 80}{Colors.RESET}")
+        lines.append(separator)
         
         # Summary
         passed = sum(1 for r in self.results if r.passed)
@@ -483,66 +767,103 @@ class SystemAuditor:
         elapsed_time = time.time() - self.start_time
         
         summary_color = Colors.GREEN if passed == total else Colors.YELLOW if passed > total / 2 else Colors.RED
-        print(f"\n{Colors.BOLD}SUMMARY:{Colors.RESET} {summary_color}{passed}/{total} checks passed{Colors.RESET}")
+        lines.append(f"\n{Colors.BOLD}SUMMARY:{Colors.RESET} {summary_color}{passed}/{total} checks passed{Colors.RESET}")
         if warnings > 0:
-            print(f"{Colors.YELLOW}Warnings: {warnings}{Colors.RESET}")
-        print(f"{Colors.BLUE}Execution time: {elapsed_time:.2f} seconds{Colors.RESET}")
+            lines.append(f"{Colors.YELLOW}Warnings: {warnings}{Colors.RESET}")
+        lines.append(f"{Colors.BLUE}Execution time: {elapsed_time:.2f} seconds{Colors.RESET}")
+        
+        # One write for the whole table
+        print('\n'.join(lines))
     
-    def generate_report(self, filename: str = "system_audit_report.txt"):
+    def _text_report(self) -> str:
+        """Render the detailed human-readable report"""
+        parts: List[str] = [
+            _SEP_EQ,
+            "SmartChat System Audit v1.0 - Detailed Report\n",
+            _SEP_EQ, "\n",
+            f"Audit Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "SYSTEM INFORMATION:\n",
+            _SEP_DASH,
+            f"Operating System: {self.system_info['os']} {self.system_info['os_version']}\n",
+            f"Architecture: {self.system_info['architecture']}\n",
+            f"Python Version: {self.system_info['python_version']}\n\n",
+            "AUDIT RESULTS:\n",
+            _SEP_DASH, "\n",
+        ]
+        
+        for result in self.results:
+            status = "PASS" if result.passed else "WARNING" if result.warning else "FAIL"
+            parts.append(f"Requirement: {result.name}\n")
+            parts.append(f"Status: {status}\n")
+            parts.append(f"Details: {result.details}\n")
+            
+            if result.fix_suggestion:
+                parts.append(f"Fix Suggestion: {result.fix_suggestion}\n")
+            
+            parts.append("\n")
+        
+        parts += [_SEP_EQ, "ENVIRONMENT VARIABLES:\n", _SEP_DASH]
+        relevant_vars = ['ANDROID_HOME', 'ANDROID_SDK_ROOT', 'JAVA_HOME', 'PATH']
+        for var in relevant_vars:
+            value = self._getenv(var, 'Not set')
+            parts.append(f"{var}: {value}\n")
+        
+        passed = sum(1 for r in self.results if r.passed)
+        total = len(self.results)
+        parts += [
+            "\n", _SEP_EQ,
+            "SUMMARY:\n",
+            _SEP_DASH,
+            f"Checks Passed: {passed}/{total}\n",
+            f"Warnings: {sum(1 for r in self.results if r.warning)}\n",
+            f"Execution Time: {time.time() - self.start_time:.2f} seconds\n",
+        ]
+        return ''.join(parts)
+    
+    def _json_report(self) -> str:
+        """Render the report as JSON for CI consumption"""
+        relevant_vars = ['ANDROID_HOME', 'ANDROID_SDK_ROOT', 'JAVA_HOME', 'PATH']
+        report = {
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'system': self.system_info,
+            'results': [
+                {
+                    'name': result.name,
+                    'status': "PASS" if result.passed else "WARNING" if result.warning else "FAIL",
+                    'passed': result.passed,
+                    'warning': result.warning,
+                    'details': result.details,
+                    'fix_suggestion': result.fix_suggestion,
+                }
+                for result in self.results
+            ],
+            'environment': {var: self._getenv(var) for var in relevant_vars},
+            'summary': {
+                'passed': sum(1 for r in self.results if r.passed),
+                'total': len(self.results),
+                'warnings': sum(1 for r in self.results if r.warning),
+                'execution_time': round(time.time() - self.start_time, 2),
+            },
+        }
+        return json.dumps(report, indent=2) + '\n'
+    
+    def generate_report(self, filename: str = "system_audit_report.txt", as_json: bool = False):
         """Generate detailed audit report file"""
-        spinner = ProgressSpinner("Generating report")
-        spinner.start()
+        GLOBAL_SPINNER.set_message("Generating report")
+        GLOBAL_SPINNER.start()
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write("=" * 80 + "\n")
-                f.write("SmartChat System Audit v1.0 - Detailed Report\n")
-                f.write("=" * 80 + "\n\n")
-                
-                f.write(f"Audit Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                
-                f.write("SYSTEM INFORMATION:\n")
-                f.write("-" * 80 + "\n")
-                f.write(f"Operating System: {self.system_info['os']} {self.system_info['os_version']}\n")
-                f.write(f"Architecture: {self.system_info['architecture']}\n")
-                f.write(f"Python Version: {self.system_info['python_version']}\n\n")
-                
-                f.write("AUDIT RESULTS:\n")
-                f.write("-" * 80 + "\n\n")
-                
-                for result in self.results:
-                    status = "PASS" if result.passed else "WARNING" if result.warning else "FAIL"
-                    f.write(f"Requirement: {result.name}\n")
-                    f.write(f"Status: {status}\n")
-                    f.write(f"Details: {result.details}\n")
-                    
-                    if result.fix_suggestion:
-                        f.write(f"Fix Suggestion: {result.fix_suggestion}\n")
-                    
-                    f.write("\n")
-                
-                f.write("=" * 80 + "\n")
-                f.write("ENVIRONMENT VARIABLES:\n")
-                f.write("-" * 80 + "\n")
-                relevant_vars = ['ANDROID_HOME', 'ANDROID_SDK_ROOT', 'JAVA_HOME', 'PATH']
-                for var in relevant_vars:
-                    value = os.environ.get(var, 'Not set')
-                    f.write(f"{var}: {value}\n")
-                
-                f.write("\n" + "=" * 80 + "\n")
-                f.write("SUMMARY:\n")
-                f.write("-" * 80 + "\n")
-                passed = sum(1 for r in self.results if r.passed)
-                total = len(self.results)
-                f.write(f"Checks Passed: {passed}/{total}\n")
-                f.write(f"Warnings: {sum(1 for r in self.results if r.warning)}\n")
-                f.write(f"Execution Time: {time.time() - self.start_time:.2f} seconds\n")
+            content = self._json_report() if as_json else self._text_report()
+            
+            # Build the whole report first so it goes out in a single write
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write(content)
             
-            spinner.stop()
+            GLOBAL_SPINNER.stop()
             print(f"\n{Colors.GREEN}✓{Colors.RESET} Report saved to: {Colors.BOLD}{filename}{Colors.RESET}")
             
         except Exception as e:
-            spinner.stop()
+            GLOBAL_SPINNER.stop()
             print(f"\n{Colors.RED}✗{Colors.RESET} Failed to generate report: {e}")
 
 def main():
@@ -555,6 +876,8 @@ Examples:
   %(prog)s                    Run standard audit
   %(prog)s --verbose          Run with detailed debug output
   %(prog)s --output report.txt  Save report to custom filename
+  %(prog)s --no-cache         Re-run every version probe
+  %(prog)s --fast             CI mode: no spinner or results table, JSON report
         """
     )
     
@@ -566,8 +889,8 @@ Examples:
     
     parser.add_argument(
         '--output', '-o',
-        default='system_audit_report.txt',
-        help='Output report filename (default: system_audit_report.txt)'
+        default=None,
+        help='Output report filename (default: system_audit_report.txt, or .json with --json)'
     )
     
     parser.add_argument(
@@ -576,16 +899,42 @@ Examples:
         help='Disable colored output'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignore cached tool versions and re-run every version probe'
+    )
+    
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Write the report as JSON'
+    )
+    
+    parser.add_argument(
+        '--fast',
+        action='store_true',
+        help='Skip the spinner and results table and write a JSON report (implies --json)'
+    )
+    
     args = parser.parse_args()
     
     if args.no_color:
         Colors.disable()
     
+    if args.fast:
+        args.json = True
+        GLOBAL_SPINNER.enabled = False
+    
+    if args.output is None:
+        args.output = 'system_audit_report.json' if args.json else 'system_audit_report.txt'
+    
     try:
-        auditor = SystemAuditor(verbose=args.verbose)
+        auditor = SystemAuditor(verbose=args.verbose, use_cache=not args.no_cache)
         auditor.run_audit()
-        auditor.print_results()
-        auditor.generate_report(args.output)
+        if not args.fast:
+            auditor.print_results()
+        auditor.generate_report(args.output, as_json=args.json)
         
         # Exit with appropriate code
         passed = sum(1 for r in auditor.results if r.passed)